@@ -15,15 +15,19 @@ Key features:
 
 * Uses the ``feedparser`` library to read RSS/Atom feeds.  Feedparser
   gracefully handles poorly formatted feeds and exposes entries via a
-  simple Python API.
-* Uses the ``googletrans`` package to translate non‑Korean content into
-  Korean.  Googletrans wraps the free Google Translate Ajax API; it
-  automatically detects source languages and supports bulk translation【713202688050716†L38-L49】.
-  If a more stable or enterprise translation API is preferred, swap
-  out the translator implementation here.
-* Stores a small cache of previously processed article identifiers in
-  ``processed_items.txt``.  This prevents duplicate notifications when
-  the script runs again.
+  simple Python API.  The feeds themselves are downloaded concurrently
+  with ``aiohttp`` and handed to feedparser as raw bytes.
+* Uses the ``deep-translator`` package to translate non‑Korean content
+  into Korean.  Its ``GoogleTranslator`` uses Google Translate's free
+  web endpoint, automatically detects source languages and is more
+  reliable than the unofficial ``googletrans`` Ajax wrapper, which
+  frequently hit rate limits.  If a more stable or enterprise translation
+  API is preferred, swap out the translator implementation here.
+* Stores previously processed article identifiers in a small SQLite
+  database (``processed.sqlite``).  This prevents duplicate
+  notifications when the script runs again.
+* Caches translations in ``translation_cache.db`` (SQLite) for 14 days
+  so recurring headlines are not re‑translated on every run.
 * Gathers matching articles into a plain‑text email body.  Each entry
   includes the source name, original title and description, a Korean
   translation (for non‑Korean sources), and a permalink.
@@ -32,13 +36,17 @@ Key features:
   environment variables so sensitive information never appears in
   the source code.
 
-Before running this script you need to install dependencies:
+Before running this script (Python 3.10 or newer) you need to install
+dependencies:
 
-    pip install feedparser googletrans==3.0.0rc1 schedule requests beautifulsoup4
+    pip install feedparser aiohttp deep-translator schedule requests lxml
 
-The ``requests`` and ``beautifulsoup4`` packages are used to scrape
+``pyahocorasick`` is optional; when installed it is used for keyword
+matching, otherwise a precompiled regular expression is used instead.
+
+The ``requests`` and ``lxml`` packages are used to scrape
 public data pages (e.g. the Ministry of Government Legislation) that
-do not expose RSS feeds.  ``googletrans`` is required for on‑the‑fly
+do not expose RSS feeds.  ``deep-translator`` is required for on‑the‑fly
 translations.
 
 Next, set up environment variables for your email account, for example:
@@ -55,13 +63,35 @@ commented out; you can uncomment it if you prefer a pure‑Python
 solution).
 """
 
+import asyncio
+import calendar
+import codecs
+import hashlib
+import itertools
+import json
 import os
+import queue
+import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
+
+import aiohttp
 
-import feedparser
-from googletrans import Translator
+# ``deep_translator``, ``feedparser`` and ``lxml`` are imported where they are
+# used: they are comparatively heavy and an hourly run that finds nothing
+# new should not pay their import cost.
+if TYPE_CHECKING:
+    from deep_translator import GoogleTranslator
+
+try:
+    import ahocorasick  # type: ignore
+except ImportError:  # pyahocorasick is optional
+    ahocorasick = None
 
 
 # ---------------------------------------------------------------------------
@@ -103,45 +133,106 @@ FEEDS: List[Dict[str, str]] = [
     # },
 ]
 
+@dataclass(slots=True)
+class Article:
+    """
+    A matched article, as collected from a feed or scraper and rendered
+    into the digest.  Slotted to keep per‑entry memory small for large
+    digests.
+
+    Attributes:
+        id: Unique identifier (GUID or link) used for de‑duplication.
+        source: Human‑readable source name.
+        title: Original title.
+        summary: Original summary/description.
+        translation: Korean translation of title and summary; empty until
+            ``translate_entries`` has run for non‑Korean articles.
+        language: Language code of the source.
+        link: Permalink to the article.
+        published: Publication date as given by the source.
+        published_ts: Publication time as a UTC timestamp (0.0 if unknown).
+    """
+
+    id: str
+    source: str
+    title: str
+    summary: str
+    translation: str
+    language: str
+    link: str = ""
+    published: str = ""
+    published_ts: float = 0.0
+
+
 # Additional Korean public sources might not provide RSS feeds.  For
 # example, the Ministry of Government Legislation’s portal
 # (https://www.moleg.go.kr) lists public datasets and announcements
 # but does not expose an Atom feed.  The function below shows how
 # such pages can be scraped manually using ``requests`` and
-# ``BeautifulSoup``.  You can extend this pattern for other
-# government sources.
+# ``lxml``.  You can extend this pattern for other government sources.
 
 import re
 import requests
-from bs4 import BeautifulSoup  # type: ignore
+from requests.adapters import HTTPAdapter
+
+# Shared HTTP session so repeated scrapes of the same host reuse pooled
+# keep‑alive connections instead of paying a TCP + TLS handshake each time.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+
+def _parse_html(response: requests.Response):
+    """
+    Parse an HTML response with lxml, decoding it correctly.
+
+    lxml only detects the encoding of raw bytes from a BOM or a
+    ``<meta charset>`` and otherwise assumes Latin‑1, which garbles
+    Korean text.  When the HTTP ``Content-Type`` header declares a
+    charset, the body is parsed from ``response.text``, which requests
+    has already decoded with Python's codecs; these know legacy Korean
+    labels such as ``ks_c_5601-1987`` that libxml2 does not.  When only
+    the document declares its encoding, the raw bytes are handed to
+    lxml directly; when nothing does, the body is decoded using
+    requests' detected encoding.
+    """
+    import lxml.html  # type: ignore
+
+    content = response.content
+    if re.search(r"charset=", response.headers.get("Content-Type", ""), re.IGNORECASE):
+        return lxml.html.fromstring(response.text)
+    if content.startswith(codecs.BOM_UTF8) or b"charset" in content[:4096].lower():
+        return lxml.html.fromstring(content)
+    response.encoding = response.apparent_encoding
+    return lxml.html.fromstring(response.text)
 
 
-def fetch_moleg_public_data(processed: set) -> List[Dict[str, str]]:
+def fetch_moleg_public_data(processed: "ProcessedStore") -> List[Article]:
     """
     Scrape the Ministry of Government Legislation’s public data page
     for new announcements.  Because the site does not publish an
     official RSS feed, we fetch the HTML, parse relevant list items
-    and return article dictionaries.  This is a simple example and
+    and return ``Article`` records.  This is a simple example and
     may need to be adjusted if the page structure changes.
 
     Args:
-        processed: set of already processed identifiers.
+        processed: Store of already processed identifiers.
 
     Returns:
-        List of article dictionaries similar to those returned by
-        ``fetch_feed``.
+        List of articles similar to those returned by ``fetch_feed``.
     """
     url = "https://www.moleg.go.kr/menu.es?mid=a10203010000"
-    results: List[Dict[str, str]] = []
+    results: List[Article] = []
     try:
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        tree = _parse_html(response)
         # Example: find list items under a section containing public data entries.
         # On the current page, announcements may be structured as <li><a>Title</a></li>.
         # Adjust the selectors based on the actual markup.
-        for link in soup.select("div.boardType01 li a"):
-            title = link.get_text(strip=True)
+        for link in tree.xpath(
+            "//div[contains(concat(' ', normalize-space(@class), ' '), ' boardType01 ')]//li//a"
+        ):
+            title = "".join(part.strip() for part in link.itertext())
             href = link.get("href")
             if not href:
                 continue
@@ -151,24 +242,23 @@ def fetch_moleg_public_data(processed: set) -> List[Dict[str, str]]:
             else:
                 full_link = href
             identifier = full_link
-            if identifier in processed:
+            # Keyword filter – shares the prebuilt matcher used for feeds
+            if not article_matches(title):
                 continue
-            # Basic keyword filter – check Korean keywords only for moleg
-            if not any(kw in title for kw in KEYWORDS_KO):
+            if not claim_identifier(identifier, processed):
                 continue
             # Since moleg pages are in Korean, translation is not required
             results.append(
-                {
-                    "id": identifier,
-                    "source": "법제처 공공데이터",
-                    "title": title,
-                    "summary": title,
-                    "translation": title,
-                    "link": full_link,
-                    "published": "",
-                }
+                Article(
+                    id=identifier,
+                    source="법제처 공공데이터",
+                    title=title,
+                    summary=title,
+                    translation=title,
+                    language="ko",
+                    link=full_link,
+                )
             )
-            processed.add(identifier)
     except Exception as exc:
         # Log or handle scraping errors
         print(f"Error scraping MOLEG public data page: {exc}")
@@ -202,25 +292,150 @@ KEYWORDS_EN: List[str] = [
     # Add more English keywords relevant to the business.
 ]
 
-# File for storing already processed entry identifiers (e.g. GUIDs or links).
+# Keywords lowered once at import time; matching is case‑insensitive.
+# Both matchers below are built from this tuple, so no keyword is ever
+# lowered on the per‑entry path.
+_KW_LOWER = tuple(kw.lower() for kw in KEYWORDS_KO + KEYWORDS_EN)
+
+# Aho–Corasick automaton over all keywords so a single pass over the
+# text finds any of them, instead of one substring scan per keyword.
+# When ``pyahocorasick`` is not installed, a precompiled alternation
+# regex gives the same single‑scan behaviour using only the stdlib.
+AUTOMATON = None
+_KW_RE = None
+if ahocorasick is not None:
+    AUTOMATON = ahocorasick.Automaton()
+    for _kw in _KW_LOWER:
+        AUTOMATON.add_word(_kw, _kw)
+    AUTOMATON.make_automaton()
+else:
+    _KW_RE = re.compile("|".join(re.escape(kw) for kw in _KW_LOWER), re.IGNORECASE)
+
+# SQLite database of already processed entries.  The ``seen`` table holds
+# entry identifiers (e.g. GUIDs or links); ``seen_content`` holds content
+# keys (BLAKE2b hashes of title + summary).  Identifiers drift over time
+# (tracking parameters, redirects), so the same article can reappear
+# under a new id; the content key catches those before they are
+# translated again.  Membership checks hit the primary‑key index, so
+# nothing has to be read into memory at startup.
+PROCESSED_DB_FILE = "processed.sqlite"
+
+# Bytes of the processed database SQLite may memory‑map, so lookups read
+# index pages straight from the OS page cache instead of copying them.
+PROCESSED_DB_MMAP_SIZE = 64 * 1024 * 1024
+
+# Plain‑text store used by earlier versions; imported into the database
+# the first time it is created.
 PROCESSED_FILE = "processed_items.txt"
 
+# Feeds are fetched concurrently; this caps the number of worker threads.
+MAX_FETCH_WORKERS = 8
 
-def load_processed() -> set:
-    """Load a set of previously processed identifiers from disk."""
-    processed = set()
-    if os.path.exists(PROCESSED_FILE):
+# Feed downloads share one aiohttp connection pool.  ``FEED_CONNECTION_LIMIT``
+# caps simultaneous connections and ``FEED_TIMEOUT`` (seconds) bounds a
+# single download.
+FEED_CONNECTION_LIMIT = 16
+FEED_TIMEOUT = 30
+
+# Per‑feed HTTP validators (``ETag`` / ``Last-Modified``) from the last
+# successful fetch, keyed by feed URL.  They are sent back as
+# ``If-None-Match`` / ``If-Modified-Since`` so unchanged feeds answer
+# with an empty 304 instead of the full document.
+FEED_STATE_FILE = "feed_state.json"
+
+# Translations are cached in batches of this size: one cache commit per
+# batch.  Each text is still its own translation request, since
+# deep-translator has no bulk endpoint.
+TRANSLATE_BATCH_SIZE = 50
+
+# deep-translator rejects inputs of 5000 characters or more (the check is
+# ``len(text) < 5000``); texts are clipped to this many characters before
+# translation.
+TRANSLATE_MAX_CHARS = 4999
+
+# Number of threads translating matched articles while the remaining
+# feeds are still being downloaded and parsed.
+TRANSLATE_WORKERS = 4
+
+# On‑disk cache of previous translations so recurring headlines are not
+# sent to the translation service again.  Entries expire after
+# ``TRANSLATION_CACHE_TTL`` seconds (14 days).
+TRANSLATION_CACHE_FILE = "translation_cache.db"
+TRANSLATION_CACHE_TTL = 14 * 24 * 60 * 60
+
+# Guards the shared processed stores while feeds are fetched in parallel.
+_processed_lock = threading.Lock()
+
+
+class ProcessedStore:
+    """
+    Set‑like view (``in`` and ``add``) over one table of the processed
+    database.  Additions become durable when ``save_processed`` commits.
+    """
+
+    def __init__(self, db: sqlite3.Connection, table: str) -> None:
+        self.db = db
+        self.table = table
+
+    def __contains__(self, key: str) -> bool:
+        return self.db.execute(
+            f"SELECT 1 FROM {self.table} WHERE id = ?", (key,)
+        ).fetchone() is not None
+
+    def add(self, key: str) -> None:
+        self.db.execute(
+            f"INSERT OR IGNORE INTO {self.table} (id, ts) VALUES (?, ?)",
+            (key, int(time.time())),
+        )
+
+
+def load_processed() -> sqlite3.Connection:
+    """
+    Open the processed‑entries database, creating it if necessary.
+
+    On first use, identifiers from the legacy ``PROCESSED_FILE`` text
+    file are imported.  Wrap the returned connection in ``ProcessedStore`` to query a table.  The
+    connection is shared by the fetch worker threads; callers serialise
+    access through ``_processed_lock``.
+    """
+    db = sqlite3.connect(PROCESSED_DB_FILE, check_same_thread=False)
+    # WAL + NORMAL sync suits an append‑mostly hourly workload.
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute(f"PRAGMA mmap_size={PROCESSED_DB_MMAP_SIZE}")
+    for table in ("seen", "seen_content"):
+        db.execute(f"CREATE TABLE IF NOT EXISTS {table} (id TEXT PRIMARY KEY, ts INTEGER)")
+    is_empty = db.execute("SELECT 1 FROM seen LIMIT 1").fetchone() is None
+    if is_empty and os.path.exists(PROCESSED_FILE):
+        now = int(time.time())
         with open(PROCESSED_FILE, "r", encoding="utf-8") as f:
-            for line in f:
-                processed.add(line.strip())
-    return processed
+            db.executemany(
+                "INSERT OR IGNORE INTO seen (id, ts) VALUES (?, ?)",
+                ((line.strip(), now) for line in f if line.strip()),
+            )
+    db.commit()
+    return db
+
 
+def save_processed(db: sqlite3.Connection) -> None:
+    """Commit the identifiers added during this run and close the database."""
+    db.commit()
+    db.close()
 
-def save_processed(processed: set) -> None:
-    """Persist the set of processed identifiers to disk."""
-    with open(PROCESSED_FILE, "w", encoding="utf-8") as f:
-        for item in sorted(processed):
-            f.write(f"{item}\n")
+
+def claim_identifier(identifier: str, processed: ProcessedStore) -> bool:
+    """
+    Atomically mark ``identifier`` as processed.
+
+    Returns:
+        True if the identifier was new (the caller should handle it),
+        False if another feed or a previous run already claimed it.
+    """
+    with _processed_lock:
+        if identifier in processed:
+            return False
+        processed.add(identifier)
+        return True
 
 
 def article_matches(text: str) -> bool:
@@ -234,39 +449,144 @@ def article_matches(text: str) -> bool:
     Returns:
         True if any keyword appears (case‑insensitive), False otherwise.
     """
-    lower_text = text.lower()
-    for kw in KEYWORDS_KO:
-        if kw.lower() in lower_text:
-            return True
-    for kw in KEYWORDS_EN:
-        if kw.lower() in lower_text:
-            return True
-    return False
+    if AUTOMATON is not None:
+        return next(AUTOMATON.iter(text.lower()), None) is not None
+    return _KW_RE.search(text) is not None
+
+
+def load_feed_state() -> Dict[str, Dict[str, str]]:
+    """Load the per‑feed ``etag``/``modified`` validators from disk."""
+    if not os.path.exists(FEED_STATE_FILE):
+        return {}
+    with open(FEED_STATE_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_feed_state(state: Dict[str, Dict[str, str]]) -> None:
+    """Persist the per‑feed validators to disk."""
+    with open(FEED_STATE_FILE, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+
+
+async def _download_feed(
+    session: aiohttp.ClientSession, feed: Dict[str, str], validators: Dict[str, str]
+) -> Tuple[Optional[bytes], Dict[str, str], Dict[str, str]]:
+    """
+    Download a single feed with a conditional GET.
+
+    Returns:
+        The raw feed document (``None`` if the server answered 304 Not
+        Modified), the validators to send next time, and the response
+        headers ``feedparser.parse`` needs to resolve relative links and
+        honour the declared charset (``content-type`` and
+        ``content-location``, the final URL after redirects).
+    """
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("modified"):
+        headers["If-Modified-Since"] = validators["modified"]
+    async with session.get(feed["url"], headers=headers) as response:
+        if response.status == 304:
+            return None, validators, {}
+        response.raise_for_status()
+        payload = await response.read()
+        new_validators = {
+            key: value
+            for key, value in (
+                ("etag", response.headers.get("ETag")),
+                ("modified", response.headers.get("Last-Modified")),
+            )
+            if value
+        }
+        response_headers = {"content-location": str(response.url)}
+        if response.headers.get("Content-Type"):
+            response_headers["content-type"] = response.headers["Content-Type"]
+        return payload, new_validators, response_headers
+
+
+FeedDownload = Union[Tuple[Optional[bytes], Dict[str, str], Dict[str, str]], BaseException]
+
+
+async def fetch_all_feeds(
+    feeds: List[Dict[str, str]],
+    state: Dict[str, Dict[str, str]],
+    on_download: Optional[Callable[[Dict[str, str], FeedDownload], None]] = None,
+) -> List[FeedDownload]:
+    """
+    Download every feed concurrently on a single event loop.
 
+    Args:
+        feeds: Feed definitions (see ``FEEDS``).
+        state: Validators from the previous run, as returned by
+            ``load_feed_state``.
+        on_download: Optional callback invoked with each feed and its
+            result as soon as that download finishes, so processing can
+            start before the slower feeds arrive.  It runs on the event
+            loop and must not block.
+
+    Returns:
+        One item per feed, in the same order: the ``(payload,
+        validators, response_headers)`` tuple from ``_download_feed``, or
+        the exception raised while downloading it.
+    """
 
-def fetch_feed(feed: Dict[str, str], processed: set, translator: Translator) -> List[Dict[str, str]]:
+    async def download(session: aiohttp.ClientSession, feed: Dict[str, str]) -> FeedDownload:
+        result: FeedDownload
+        try:
+            result = await _download_feed(session, feed, state.get(feed["url"], {}))
+        except Exception as exc:
+            result = exc
+        if on_download is not None:
+            on_download(feed, result)
+        return result
+
+    connector = aiohttp.TCPConnector(limit=FEED_CONNECTION_LIMIT, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=FEED_TIMEOUT)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        return await asyncio.gather(*(download(session, feed) for feed in feeds))
+
+
+def fetch_feed(
+    feed: Dict[str, str],
+    payload: bytes,
+    response_headers: Dict[str, str],
+    processed: ProcessedStore,
+    processed_content: ProcessedStore,
+) -> List[Article]:
     """
-    Parse a single feed and return a list of new entries that match
-    the configured keywords.  Each result includes the original
-    language title/summary, a Korean translation (if necessary), and
-    source metadata.
+    Parse a single downloaded feed and return a list of new entries
+    that match the configured keywords.  Each result includes the
+    original language title/summary and source metadata.  Entries from
+    non‑Korean feeds are returned with an empty ``translation``; fill
+    it in with ``translate_entries``.
 
     Args:
         feed: A dictionary describing the feed (name, url, language).
-        processed: A set of identifiers of already processed entries.
-        translator: An instance of googletrans.Translator for
-            translations.
+        payload: The raw feed document downloaded by ``fetch_all_feeds``.
+        response_headers: The matching response headers from
+            ``fetch_all_feeds``, used to resolve relative links and pick
+            the declared encoding.
+        processed: Store of identifiers of already processed entries.
+        processed_content: Store of content keys of already processed
+            entries, used to catch the same article under a new id.
 
     Returns:
-        A list of dictionaries representing matched articles.
+        A list of matched articles.
     """
-    results = []
-    parsed = feedparser.parse(feed["url"])
+    import feedparser
+
+    results: List[Article] = []
+    # feedparser accepts the raw bytes directly, so it never opens a
+    # connection of its own; the HTTP context it would otherwise have
+    # (base URL, charset) is passed in via ``response_headers``.
+    parsed = feedparser.parse(payload, response_headers=response_headers)
     for entry in parsed.entries:
         # Use the entry link or guid as a unique identifier
-        identifier = entry.get("id") or entry.get("guid") or entry.get("link")
-        if not identifier or identifier in processed:
-            continue  # skip duplicates
+        link = entry.get("link", "")
+        identifier = entry.get("id") or entry.get("guid") or link
+        if not identifier:
+            continue
 
         # Combine title and summary for keyword search
         title = entry.get("title", "")
@@ -275,63 +595,187 @@ def fetch_feed(feed: Dict[str, str], processed: set, translator: Translator) ->
 
         if not article_matches(combined):
             continue  # skip irrelevant articles
+        # Only matched entries reach the processed store (and its lock)
+        if not claim_identifier(identifier, processed):
+            continue  # skip duplicates
+        content_key = hashlib.blake2b(combined.encode("utf-8"), digest_size=16).hexdigest()
+        if not claim_identifier(content_key, processed_content):
+            continue  # same article seen before under a different id
 
-        # Prepare translation if the feed is not Korean
-        if feed["language"] != "ko":
-            try:
-                translated = translator.translate(combined, dest="ko").text
-            except Exception as exc:
-                translated = f"(번역 오류: {exc})"
-        else:
-            translated = combined
+        # Korean entries need no translation; others are translated in
+        # bulk later by ``translate_entries``.
+        translated = combined if feed["language"] == "ko" else ""
 
+        # feedparser already normalises the date to a UTC struct_time;
+        # keep it as a timestamp for sorting.
+        published_parsed = entry.get("published_parsed")
         results.append(
-            {
-                "id": identifier,
-                "source": feed["name"],
-                "title": title.strip(),
-                "summary": summary.strip(),
-                "translation": translated.strip(),
-                "link": entry.get("link", ""),
-                "published": entry.get("published", ""),
-            }
+            Article(
+                id=identifier,
+                source=feed["name"],
+                title=title.strip(),
+                summary=summary.strip(),
+                translation=translated.strip(),
+                language=feed["language"],
+                link=link,
+                published=entry.get("published", ""),
+                published_ts=float(calendar.timegm(published_parsed)) if published_parsed else 0.0,
+            )
         )
-        processed.add(identifier)
 
     return results
 
 
-def build_digest(entries: List[Dict[str, str]]) -> str:
+def open_translation_cache() -> sqlite3.Connection:
+    """Open the translation cache, creating it and dropping expired rows."""
+    cache = sqlite3.connect(TRANSLATION_CACHE_FILE)
+    # Several translator threads may use the cache at once; WAL lets
+    # their reads proceed while another thread writes.
+    cache.execute("PRAGMA journal_mode=WAL")
+    cache.execute(
+        "CREATE TABLE IF NOT EXISTS translations ("
+        " key BLOB NOT NULL,"
+        " target_lang TEXT NOT NULL,"
+        " translated TEXT NOT NULL,"
+        " ts INTEGER NOT NULL,"
+        " PRIMARY KEY (key, target_lang))"
+    )
+    cache.execute(
+        "DELETE FROM translations WHERE ts < ?",
+        (int(time.time()) - TRANSLATION_CACHE_TTL,),
+    )
+    cache.commit()
+    return cache
+
+
+def cached_translate(
+    texts: List[str],
+    dest: str,
+    translator: "GoogleTranslator",
+    cache: sqlite3.Connection,
+) -> List[str]:
+    """
+    Translate ``texts`` into ``dest``, consulting the on‑disk cache first.
+
+    Cache keys are the SHA‑256 digest of the source text, so key size
+    stays bounded regardless of article length.  Only cache misses are
+    sent to the translator, one request per text, and every successful
+    result is stored for later runs.  A failed request only affects its
+    own text, which gets an error note instead of a translation.
+
+    Args:
+        texts: Source strings to translate.
+        dest: Target language code, e.g. ``"ko"``.
+        translator: A ``deep_translator.GoogleTranslator`` whose target
+            language is ``dest``.
+        cache: Connection returned by ``open_translation_cache``.
+
+    Returns:
+        The translations, in the same order as ``texts``.
+    """
+    keys = [hashlib.sha256(text.encode("utf-8")).digest() for text in texts]
+    results: List[Optional[str]] = []
+    for key in keys:
+        row = cache.execute(
+            "SELECT translated FROM translations WHERE key = ? AND target_lang = ?",
+            (key, dest),
+        ).fetchone()
+        results.append(row[0] if row else None)
+
+    misses = [i for i, result in enumerate(results) if result is None]
+    now = int(time.time())
+    for i in misses:
+        try:
+            result = translator.translate(texts[i])
+        except Exception as exc:
+            results[i] = f"(번역 오류: {exc})"
+            continue
+        results[i] = result or ""
+        if not result:
+            continue  # don't cache empty responses
+        cache.execute(
+            "INSERT OR REPLACE INTO translations (key, target_lang, translated, ts)"
+            " VALUES (?, ?, ?, ?)",
+            (keys[i], dest, result, now),
+        )
+    if misses:
+        cache.commit()
+    return results
+
+
+def translate_entries(entries: List[Article], translator: "GoogleTranslator") -> None:
+    """
+    Translate all non‑Korean entries into Korean in place.
+
+    Previously seen texts are served from the translation cache; the
+    rest are translated one request per text, with cache writes
+    committed every ``TRANSLATE_BATCH_SIZE`` items.
+
+    Args:
+        entries: Articles as returned by ``fetch_feed``.
+        translator: A ``deep_translator.GoogleTranslator`` targeting Korean.
+    """
+    pending = [item for item in entries if item.language != "ko"]
+    if not pending:
+        return
+    cache = open_translation_cache()
+    try:
+        for start in range(0, len(pending), TRANSLATE_BATCH_SIZE):
+            batch = pending[start:start + TRANSLATE_BATCH_SIZE]
+            texts = [f"{item.title}\n{item.summary}"[:TRANSLATE_MAX_CHARS] for item in batch]
+            translated = cached_translate(texts, "ko", translator, cache)
+            for item, text in zip(batch, translated):
+                item.translation = text.strip()
+    finally:
+        cache.close()
+
+
+# Digest layout.  Each entry is rendered from ``ENTRY_TMPL`` in one
+# ``str.format`` call; the optional lines (publication date, Korean
+# translation, link) are passed in pre‑rendered, or as empty strings
+# when absent.
+DIGEST_HEADER_TMPL = "규제 준수 뉴스 요약 – {timestamp} (Asia/Seoul 기준)\n" + "−" * 60
+ENTRY_TMPL = "{idx}. [{source}] {title}\n{published}   원문 요약: {summary}\n{translation}{link}"
+
+
+def _format_entry(idx: int, item: Article) -> str:
+    """Render a single digest entry, including its trailing blank line."""
+    return ENTRY_TMPL.format(
+        idx=idx,
+        source=item.source,
+        title=item.title,
+        published=f"   발행일: {item.published}\n" if item.published else "",
+        summary=item.summary,
+        # Korean translation (will be identical to summary for Korean sources)
+        # Add translation only if it differs from the original
+        translation=(
+            f"   한국어 번역: {item.translation}\n"
+            if item.translation and item.translation != item.summary
+            else ""
+        ),
+        link=f"   링크: {item.link}\n" if item.link else "",
+    )
+
+
+def build_digest(entries: List[Article]) -> str:
     """
     Build a plain‑text digest from the list of entries.  Each entry
     includes the original language and Korean translation (if needed).
 
     Args:
-        entries: List of article dictionaries.
+        entries: List of articles.
 
     Returns:
         A string suitable for inclusion in an email body.
     """
-    lines = []
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    lines.append(f"규제 준수 뉴스 요약 – {timestamp} (Asia/Seoul 기준)")
-    lines.append("".rjust(60, "−"))
-    for idx, item in enumerate(entries, 1):
-        lines.append(f"{idx}. [{item['source']}] {item['title']}")
-        # Include publication date if available
-        if item.get("published"):
-            lines.append(f"   발행일: {item['published']}")
-        # Original language summary
-        lines.append(f"   원문 요약: {item['summary']}")
-        # Korean translation (will be identical to summary for Korean sources)
-        # Add translation only if it differs from the original
-        if item["translation"] and item["translation"] != item["summary"]:
-            lines.append(f"   한국어 번역: {item['translation']}")
-        # Provide the link for further reading
-        if item.get("link"):
-            lines.append(f"   링크: {item['link']}")
-        lines.append("")  # blank line between entries
-    return "\n".join(lines)
+    header = DIGEST_HEADER_TMPL.format(timestamp=timestamp)
+    return "\n".join(
+        itertools.chain(
+            (header,),
+            (_format_entry(idx, item) for idx, item in enumerate(entries, 1)),
+        )
+    )
 
 
 def send_email(subject: str, body: str) -> None:
@@ -366,29 +810,132 @@ def send_email(subject: str, body: str) -> None:
         server.sendmail(smtp_user, recipients, msg.as_string())
 
 
+def _translate_worker(translate_queue: "queue.Queue[Optional[List[Article]]]") -> None:
+    """
+    Translate batches of articles from ``translate_queue`` until a
+    ``None`` sentinel arrives.  The translator is created on the first
+    batch, so runs without foreign‑language matches never import it.
+    """
+    translator = None
+    while True:
+        batch = translate_queue.get()
+        if batch is None:
+            return
+        if translator is None:
+            from deep_translator import GoogleTranslator
+
+            translator = GoogleTranslator(source="auto", target="ko")
+        translate_entries(batch, translator)
+
+
+def _fetch_and_enqueue(
+    feed: Dict[str, str],
+    payload: bytes,
+    response_headers: Dict[str, str],
+    processed: ProcessedStore,
+    processed_content: ProcessedStore,
+    translate_queue: "queue.Queue[Optional[List[Article]]]",
+) -> List[Article]:
+    """Run ``fetch_feed`` and hand its non‑Korean matches to the translators."""
+    entries = fetch_feed(feed, payload, response_headers, processed, processed_content)
+    pending = [item for item in entries if item.language != "ko"]
+    if pending:
+        translate_queue.put(pending)
+    return entries
+
+
+def collect_articles(
+    processed: ProcessedStore,
+    processed_content: ProcessedStore,
+    feed_state: Dict[str, Dict[str, str]],
+) -> List[Article]:
+    """
+    Fetch, filter and translate articles from every configured source.
+
+    The work is pipelined: each feed is parsed as soon as its download
+    completes, and its matches are queued for a separate pool of
+    ``TRANSLATE_WORKERS`` translator threads, so translation requests
+    are in flight while other feeds are still downloading or parsing.
+
+    Args:
+        processed: Store of identifiers of already processed entries.
+        processed_content: Store of content keys of already processed
+            entries.
+        feed_state: Per‑feed validators; updated in place for every feed
+            that was processed successfully.
+
+    Returns:
+        All new matching articles, translated where necessary.
+    """
+    all_entries: List[Article] = []
+    translate_queue: "queue.Queue[Optional[List[Article]]]" = queue.Queue()
+    with ThreadPoolExecutor(max_workers=TRANSLATE_WORKERS) as translate_pool:
+        translate_futures = [
+            translate_pool.submit(_translate_worker, translate_queue)
+            for _ in range(TRANSLATE_WORKERS)
+        ]
+        try:
+            # Feed fetching is I/O bound, so run every feed (and the MOLEG
+            # scraper) concurrently; total wall time becomes that of the
+            # slowest source rather than the sum of all of them.
+            with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+                moleg_future = executor.submit(fetch_moleg_public_data, processed)
+                feed_futures = []
+
+                def on_download(feed: Dict[str, str], download: FeedDownload) -> None:
+                    if isinstance(download, BaseException):
+                        print(f"Error downloading feed {feed['name']}: {download}")
+                        return
+                    payload, validators, response_headers = download
+                    if payload is None:
+                        return  # 304 Not Modified: nothing new since last run
+                    future = executor.submit(
+                        _fetch_and_enqueue,
+                        feed,
+                        payload,
+                        response_headers,
+                        processed,
+                        processed_content,
+                        translate_queue,
+                    )
+                    feed_futures.append((feed, validators, future))
+
+                # All feed downloads share one event loop; each feed is
+                # parsed on the worker threads as soon as it arrives.
+                asyncio.run(fetch_all_feeds(FEEDS, feed_state, on_download))
+                for feed, validators, future in feed_futures:
+                    try:
+                        all_entries.extend(future.result())
+                        # Only remember validators once the feed was processed, so
+                        # a failed parse is retried with a full download next time.
+                        feed_state[feed["url"]] = validators
+                    except Exception as exc:
+                        # In production you might log this exception or send an alert
+                        print(f"Error processing feed {feed['name']}: {exc}")
+                # Additional sources such as the MOLEG public data page
+                all_entries.extend(moleg_future.result())
+        finally:
+            # No more work will be queued; let each translator drain and exit.
+            for _ in translate_futures:
+                translate_queue.put(None)
+        for future in translate_futures:
+            future.result()
+    return all_entries
+
+
 def run_once() -> None:
     """Fetch feeds, build a digest and send it via email if there are results."""
-    processed = load_processed()
-    translator = Translator(service_urls=["translate.google.co.kr", "translate.google.com"])
-    all_entries: List[Dict[str, str]] = []
-    for feed in FEEDS:
-        try:
-            entries = fetch_feed(feed, processed, translator)
-            all_entries.extend(entries)
-        except Exception as exc:
-            # In production you might log this exception or send an alert
-            print(f"Error processing feed {feed['name']}: {exc}")
-    # Fetch additional sources such as MOLEG public data page
-    more_entries = fetch_moleg_public_data(processed)
-    all_entries.extend(more_entries)
+    processed_db = load_processed()
+    processed = ProcessedStore(processed_db, "seen")
+    processed_content = ProcessedStore(processed_db, "seen_content")
+    feed_state = load_feed_state()
+    all_entries = collect_articles(processed, processed_content, feed_state)
     # Persist processed identifiers to avoid duplicates on next run
-    save_processed(processed)
+    save_processed(processed_db)
+    save_feed_state(feed_state)
     if all_entries:
-        # Sort entries by published date descending (if available)
-        try:
-            all_entries.sort(key=lambda x: x.get("published", ""), reverse=True)
-        except Exception:
-            pass
+        # Sort entries by published date descending (undated entries last)
+        all_entries.sort(key=attrgetter("published_ts"), reverse=True)
         body = build_digest(all_entries)
         subject = "[Compliance Digest] 신규 규제 소식 / 법률 변경 알림"
         send_email(subject, body)